@@ -0,0 +1,26 @@
+"""
+Regex matching that runs in the worker processes of main.regex_pool. Kept out of
+main.py so the spawned processes only import `re`, not Telethon, FastAPI or Motor.
+"""
+import re
+
+
+def search(pattern, texts):
+    """
+    Return the indexes of the texts a pattern matches.
+    """
+    compiled = re.compile(pattern)  # `re` tự cache pattern đã compile
+    return [index for index, text in enumerate(texts) if compiled.search(text)]
+
+
+def serve(conn):
+    """
+    Worker loop: answer (pattern, texts) jobs on a pipe until the parent closes it.
+    """
+    conn.send("ready")
+    while True:
+        try:
+            pattern, texts = conn.recv()
+        except EOFError:
+            return
+        conn.send(search(pattern, texts))
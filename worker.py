@@ -0,0 +1,66 @@
+"""
+Forwarding worker: runs the Telethon clients and forwarding sessions without the
+HTTP API. Start the API with APP_ROLE=api so it only writes to MongoDB.
+
+    python worker.py
+
+With WORKER_PROCESSES=N the accounts are spread over N processes, each with its
+own event loop, by consistent hashing on phone_number.
+"""
+import asyncio
+import multiprocessing
+import os
+import signal
+import threading
+
+WORKER_STOP_TIMEOUT = float(os.getenv("WORKER_STOP_TIMEOUT", "30"))  # Seconds a slot may take to shut down
+
+
+def run_slot(slot, slots):
+    os.environ["APP_ROLE"] = "worker"
+    os.environ["WORKER_SLOT"] = str(slot)
+    os.environ["WORKER_SLOTS"] = str(slots)
+
+    import main  # Import sau khi đặt biến môi trường, vì main đọc cấu hình lúc import
+
+    asyncio.run(main.run_worker())
+
+
+def run_processes(slots):
+    """
+    Start one process per slot and restart any that exits. On SIGTERM or SIGINT the
+    slots are terminated, which lets each one flush its checkpoints, and joined.
+    """
+    context = multiprocessing.get_context("spawn")
+    processes = {}
+    stopping = threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda signum, frame: stopping.set())
+    try:
+        while not stopping.is_set():
+            for slot in range(slots):
+                process = processes.get(slot)
+                if process is None or not process.is_alive():
+                    if process is not None:
+                        print(f"Worker slot {slot} exited with code {process.exitcode}, restarting.")
+                    process = context.Process(target=run_slot, args=(slot, slots), name=f"worker-{slot}")
+                    process.start()
+                    processes[slot] = process
+            stopping.wait(5)
+    finally:
+        for process in processes.values():
+            process.terminate()  # SIGTERM: run_worker ghi checkpoint rồi mới thoát
+        for process in processes.values():
+            process.join(WORKER_STOP_TIMEOUT)
+            if process.is_alive():
+                print(f"Worker {process.name} did not stop in {WORKER_STOP_TIMEOUT}s, killing it.")
+                process.kill()
+                process.join()
+
+
+if __name__ == "__main__":
+    worker_processes = int(os.getenv("WORKER_PROCESSES", "1"))
+    if worker_processes > 1:
+        run_processes(worker_processes)
+    else:
+        run_slot(int(os.getenv("WORKER_SLOT", "0")), int(os.getenv("WORKER_SLOTS", "1")))